@@ -4,49 +4,71 @@ import random
 import logging
 import streamlit as st
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
 from newspaper import Article
 import spacy
 from spacy.util import is_package
 from spacy.cli import download as spacy_download
 import re
+import ahocorasick
 from urllib.parse import quote, urlparse
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import BytesIO
 import time
-from dateparser.search import search_dates
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import dateparser
+from dateparser.date import DateDataParser
 import nltk
 
 # ------------------ small helpers for model/data downloads ------------------
+@st.cache_resource(show_spinner=False)
 def ensure_nltk_punkt():
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt")
+    # nltk >= 3.8.2 tokenises with punkt_tab; older releases still read punkt
+    for resource in ("punkt", "punkt_tab"):
+        try:
+            nltk.data.find(f"tokenizers/{resource}")
+        except LookupError:
+            nltk.download(resource)
 
-def load_spacy_model(name="en_core_web_sm"):
+def load_spacy_model(name="en_core_web_sm", disable=()):
     """Try to load a spaCy model; if missing, download it, else fallback to blank 'en'."""
     try:
         if is_package(name):
-            return spacy.load(name)
+            return spacy.load(name, disable=disable)
         try:
-            return spacy.load(name)
+            return spacy.load(name, disable=disable)
         except OSError:
             logging.info(f"spaCy model {name} not found — attempting runtime download.")
             try:
                 spacy_download(name)
             except Exception as e:
                 logging.exception("Runtime spaCy download failed: %s", e)
-            return spacy.load(name)
+            return spacy.load(name, disable=disable)
     except Exception as e:
         logging.exception("spaCy model load failed entirely, falling back to blank pipeline: %s", e)
         return spacy.blank("en")
 
+# Only entity labels are used, so skip the tagger/parser/lemmatizer work
+NLP_DISABLED = ["parser", "tagger", "attribute_ruler", "lemmatizer"]
+NLP_MAX_LENGTH = 200_000
+
+# Cached across reruns and sessions so the model is loaded once per process
+@st.cache_resource(show_spinner=False)
+def get_nlp():
+    model = load_spacy_model("en_core_web_sm", disable=NLP_DISABLED)
+    # fail fast on oversized input rather than risk the 1M-char default
+    model.max_length = NLP_MAX_LENGTH
+    return model
+
 # Ensure small external data is present
 ensure_nltk_punkt()
-nlp = load_spacy_model("en_core_web_sm")
+nlp = get_nlp()
 
 # ---------------------- CONFIG ----------------------
 CATEGORY_KEYWORDS = {
@@ -58,51 +80,138 @@ CATEGORY_KEYWORDS = {
     "Brief Mentions": ["congratulations", "appointed", "wins", "promotion", "award", "linkedin update"],
 }
 
+def build_keyword_automaton(pairs):
+    """Build an Aho-Corasick automaton from (keyword, value) pairs; keywords are matched lower-cased."""
+    pairs = [(kw.lower(), value) for kw, value in pairs if kw]
+    if not pairs:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, value in pairs:
+        # first occurrence wins, matching the old dict-order priority
+        if not automaton.exists(kw):
+            automaton.add_word(kw, value)
+    automaton.make_automaton()
+    return automaton
+
+CATEGORY_PRIORITY = {category: i for i, category in enumerate(CATEGORY_KEYWORDS)}
+CATEGORY_AUTOMATON = build_keyword_automaton(
+    (kw, category) for category, kws in CATEGORY_KEYWORDS.items() for kw in kws
+)
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
     "Mozilla/5.0 (X11; Linux x86_64)"
 ]
-HEADERS = {"User-Agent": random.choice(USER_AGENTS)}
+URL_DATE_RE = re.compile(r'(\d{4}[-/]\d{2}[-/]\d{2})|(\d{8})|(\d{14})')
+_MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?'
+# Common date shapes in article text; each match is handed to the shared DateDataParser
+_DATE_PREFILTER = re.compile(
+    r'\b(?:\d{4}-\d{2}-\d{2}'
+    r'|' + _MONTH + r'\s+\d{1,2},?\s+\d{4}'
+    r'|\d{1,2}\s+' + _MONTH + r',?\s+\d{4})\b',
+    re.I,
+)
+# one parser instance shared by every text-date lookup. Fetch workers call it (and
+# dateparser.parse's own shared parser) concurrently; dateparser >= 1.4.3 locks its
+# per-parser state internally, so no extra locking is needed here.
+_DDP = DateDataParser(languages=['en'], settings={"PREFER_DATES_FROM": "past"})
+FETCH_WORKERS = 24
+# kept low so concurrent keyword searches stay polite to Bing
+BING_WORKERS = 2
+SUMMARY_SENTENCES = 5
+NER_BATCH_SIZE = 32
+# entities of interest sit in the lede/nut graf, so NER only sees the opening text
+NER_MAX_CHARS = 8000
+ENTITY_LABELS = ("PERSON", "ORG", "GPE")
+
+RESULT_COLUMNS = [
+    "Title", "URL", "Published Date", "Event Date", "Leader Mentioned",
+    "Matched Keywords", "Category", "Named Entities", "Summary",
+]
+FAILED_COLUMNS = ["Title", "URL", "Published Date", "Matched Keywords"]
+
+HTTP_CACHE_NAME = "media_tracker_http"
+HTTP_CACHE_EXPIRY = timedelta(hours=6)
+
+# One pooled session for Bing and article hosts so keep-alive connections are reused.
+# Article bodies are cached on disk (with ETag/Last-Modified revalidation once stale);
+# Bing search pages are never cached so results stay fresh.
+SESSION = requests_cache.CachedSession(
+    HTTP_CACHE_NAME,
+    backend="sqlite",
+    expire_after=HTTP_CACHE_EXPIRY,
+    urls_expire_after={"*.bing.com": requests_cache.DO_NOT_CACHE},
+    allowable_codes=(200,),
+    stale_if_error=True,
+)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
 
 # ---------------------- HELPERS ----------------------
+def _headers():
+    """Per-request headers; the User-Agent rotates while the pooled session is reused."""
+    return {"User-Agent": random.choice(USER_AGENTS), "Accept-Encoding": "gzip, deflate"}
+
 def _make_naive(dt):
     if isinstance(dt, datetime) and dt.tzinfo is not None:
         return dt.replace(tzinfo=None)
     return dt
 
+META_DATE_PROPS = [
+    "article:published_time", "og:published_time", "datePublished",
+    "publish_date", "pubdate", "publishdate", "date", "article:published",
+    "parsely-pub-date", "dc.date", "dc.date.issued", "date"
+]
+META_ATTRS = ("property", "name", "itemprop")
+
 # (Keep your date-extraction helpers exactly as before)
 def extract_date_from_meta(html):
-    soup = BeautifulSoup(html, "html.parser")
-    meta_props = [
-        "article:published_time", "og:published_time", "datePublished",
-        "publish_date", "pubdate", "publishdate", "date", "article:published",
-        "parsely-pub-date", "dc.date", "dc.date.issued", "date"
-    ]
-    for prop in meta_props:
-        tag = soup.find("meta", attrs={"property": prop}) or soup.find("meta", attrs={"name": prop}) or soup.find("meta", itemprop=prop)
-        if tag:
-            content = tag.get("content")
+    # only <meta> tags are needed, so don't build the rest of the DOM
+    soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer("meta"))
+    contents = {}
+    for tag in soup.find_all("meta"):
+        content = tag.get("content")
+        if not content:
+            continue
+        for attr in META_ATTRS:
+            key = tag.get(attr)
+            if key:
+                contents.setdefault((attr, key), content)
+    for prop in META_DATE_PROPS:
+        for attr in META_ATTRS:
+            content = contents.get((attr, prop))
             if content:
                 date_obj = dateparser.parse(content)
                 if date_obj:
                     return _make_naive(date_obj)
+                break
     return None
 
+@lru_cache(maxsize=1024)
+def _parse_date_string(value):
+    return _make_naive(_DDP.get_date_data(value).date_obj)
+
+def _iter_text_dates(text):
+    """Yield parsed dates for each date-like match in text, in order of appearance."""
+    for match in _DATE_PREFILTER.finditer(text or ""):
+        date_obj = _parse_date_string(match.group(0))
+        if date_obj:
+            yield date_obj
+
+def _first_date_in(text):
+    return next(_iter_text_dates(text), None)
+
 def extract_date_from_text(text):
-    if not text:
-        return None
-    dates = search_dates(text, languages=['en'], settings={'PREFER_DATES_FROM': 'past'})
-    if dates:
-        now = datetime.now()
-        for _, date_obj in dates:
-            date_obj = _make_naive(date_obj)
-            if date_obj and date_obj.year >= 2000 and date_obj.date() <= now.date():
-                return date_obj
+    today = datetime.now().date()
+    for date_obj in _iter_text_dates(text):
+        if date_obj.year >= 2000 and date_obj.date() <= today:
+            return date_obj
     return None
 
 def extract_date_from_url(url):
-    match = re.search(r'(\d{4}[-/]\d{2}[-/]\d{2})|(\d{8})|(\d{14})', url)
+    match = URL_DATE_RE.search(url)
     if match:
         try:
             val = match.group(1) or match.group(2) or match.group(3)
@@ -114,28 +223,29 @@ def extract_date_from_url(url):
             return None
     return None
 
-def fetch_full_text_and_summary(url):
+# Cached only on success: failures raise so a timeout or 429 is retried on the next run
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_article(url):
     full_text, pub_date, summary = None, None, None
-    html = None
+    # Download once through the pooled session; newspaper and the fallback share the HTML.
+    # Raw bytes, not res.text: requests assumes ISO-8859-1 when Content-Type has no charset,
+    # while newspaper, BeautifulSoup and lxml detect the real encoding from the bytes.
+    res = SESSION.get(url, headers=_headers(), timeout=15)
+    res.raise_for_status()
+    html = res.content
+
     try:
         article = Article(url)
-        article.download()
+        article.set_html(html)
         article.parse()
-        article.nlp()
         full_text = article.text.strip()
-        summary = article.summary
-        html = article.html
         pub_date = _make_naive(article.publish_date)
     except Exception:
-        try:
-            res = requests.get(url, headers=HEADERS, timeout=15)
-            res.raise_for_status()
-            html = res.text
-            soup = BeautifulSoup(html, "html.parser")
-            paragraphs = soup.find_all("p")
-            full_text = "\n".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-        except Exception:
-            return None, None, None
+        # pull paragraph text straight from lxml; no soup needed on this path.
+        # lxml gets the raw bytes since it rejects str input carrying an <?xml encoding=...?> declaration
+        tree = lxml.html.fromstring(html)
+        paragraphs = (p.text_content().strip() for p in tree.xpath("//p"))
+        full_text = "\n".join(p for p in paragraphs if p)
 
     if not pub_date and html:
         pub_date = extract_date_from_meta(html)
@@ -146,103 +256,233 @@ def fetch_full_text_and_summary(url):
 
     return full_text, pub_date, summary
 
-def categorize_article(text: str) -> str:
-    text = (text or "").lower()
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text:
-                return category
-    return "Brief Mentions"
+def fetch_full_text_and_summary(url):
+    try:
+        return _fetch_article(url)
+    except Exception as e:
+        logging.warning("Could not fetch article %s: %s", url, e)
+        return None, None, None
 
-def extract_named_entities(text):
+def summarize_text(text, max_sentences=SUMMARY_SENTENCES):
+    """Cheap extractive summary: the lead sentences of the article."""
     if not text:
-        return []
-    doc = nlp(text)
-    return [ent.text for ent in doc.ents if ent.label_ in ("PERSON", "ORG", "GPE")]
+        return None
+    try:
+        sentences = nltk.sent_tokenize(text)
+    except LookupError as e:
+        logging.warning("NLTK sentence tokenizer unavailable, skipping summary: %s", e)
+        return None
+    return " ".join(sentences[:max_sentences]) or None
+
+def categorize_article(text: str, text_lc: str = None) -> str:
+    if text_lc is None:
+        text_lc = (text or "").lower()
+    hits = {category for _, category in CATEGORY_AUTOMATON.iter(text_lc)}
+    if hits:
+        # keep CATEGORY_KEYWORDS order as the tie-breaker, not position in the text
+        return min(hits, key=CATEGORY_PRIORITY.__getitem__)
+    return "Brief Mentions"
+
+def _entities_from_doc(doc):
+    """Group consecutive B/I tokens of the wanted labels, without building doc.ents spans."""
+    entities = []
+    current, current_label = [], None
+    for tok in doc:
+        if tok.ent_iob_ == "B" and tok.ent_type_ in ENTITY_LABELS:
+            if current:
+                entities.append("".join(current).strip())
+            current, current_label = [tok.text_with_ws], tok.ent_type_
+        elif tok.ent_iob_ == "I" and current_label == tok.ent_type_:
+            current.append(tok.text_with_ws)
+        else:
+            if current:
+                entities.append("".join(current).strip())
+            current, current_label = [], None
+    if current:
+        entities.append("".join(current).strip())
+    return entities
+
+def extract_named_entities(texts):
+    """Run NER over a batch of texts; returns one entity list per input text."""
+    texts = [(text or "")[:NER_MAX_CHARS] for text in texts]
+    results = [[] for _ in texts]
+    non_empty = [(text, i) for i, text in enumerate(texts) if text]
+    for doc, i in nlp.pipe(non_empty, as_tuples=True, batch_size=NER_BATCH_SIZE, n_process=1):
+        results[i] = _entities_from_doc(doc)
+    return results
 
 def extract_event_date(text: str) -> str:
-    dates = search_dates(text, settings={"PREFER_DATES_FROM": "past"})
-    if dates:
-        return dates[0][1].strftime('%Y-%m-%d')
+    date_obj = _first_date_in(text)
+    if date_obj:
+        return date_obj.strftime('%Y-%m-%d')
     return "Not Mentioned"
 
-def contains_keywords(text, keywords):
-    text = (text or "").lower()
-    return any(k.lower() in text for k in keywords)
+def find_keywords(text, automaton, text_lc=None):
+    """Return the set of automaton values whose keyword occurs in text."""
+    if automaton is None or not text:
+        return set()
+    if text_lc is None:
+        text_lc = text.lower()
+    return {value for _, value in automaton.iter(text_lc)}
+
+def contains_keywords(text, automaton, text_lc=None):
+    if automaton is None or not text:
+        return False
+    if text_lc is None:
+        text_lc = text.lower()
+    return next(automaton.iter(text_lc), None) is not None
+
+def _sort_columns(columns, keys):
+    """Reorder every column list by the matching sort key."""
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return {col: [values[i] for i in order] for col, values in columns.items()}
 
 # Main tracker (same as your version)
 def run_tracker(keywords, leaders, start_date, end_date):
-    final_data = []
-    failed_articles = []
-    all_keywords = list(set(keywords + leaders))
-
-    for keyword in keywords:
-        search_results = search_urls_bing_news(keyword)
-        for result in search_results:
+    # built column by column so the DataFrames are assembled in one allocation at the end
+    final_data = {col: [] for col in RESULT_COLUMNS}
+    final_texts = []
+    failed_articles = {col: [] for col in FAILED_COLUMNS}
+    final_order, failed_order = [], []
+    # lower-cased and de-duplicated once per run, keeping the user's order
+    all_keywords_lc = tuple(dict.fromkeys(k.lower() for k in keywords + leaders))
+    keyword_automaton = build_keyword_automaton((k, k) for k in all_keywords_lc)
+    leader_automaton = build_keyword_automaton((l, l.lower()) for l in leaders)
+
+    # Bing searches run a few at a time and each results page is queued for download
+    # as soon as it arrives; a URL surfaced by several keywords is fetched only once
+    url_to_meta = {}
+    futures = {}
+    meta_lock = threading.Lock()
+
+    def queue_keyword_results(keyword_index, keyword, executor):
+        for rank, result in enumerate(iter_bing_news_results(keyword)):
             url = result["url"]
-            title = result["title"]
+            # (keyword index, Bing rank) keeps titles and row order independent of
+            # which search happens to finish first
+            order = (keyword_index, rank)
             pub_date_from_url = extract_date_from_url(url)
+            with meta_lock:
+                if url not in url_to_meta:
+                    url_to_meta[url] = {"title": result["title"], "keywords": set(), "url_date": pub_date_from_url, "order": order}
+                    # a dated URL outside the range is dropped without downloading it
+                    if not pub_date_from_url or start_date <= pub_date_from_url.date() <= end_date:
+                        futures[executor.submit(fetch_full_text_and_summary, url)] = url
+                elif order < url_to_meta[url]["order"]:
+                    url_to_meta[url].update(title=result["title"], order=order)
+                url_to_meta[url]["keywords"].add(keyword)
+
+    with ThreadPoolExecutor(max_workers=BING_WORKERS) as search_executor, \
+            ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        searches = {
+            search_executor.submit(queue_keyword_results, keyword_index, keyword, executor): keyword
+            for keyword_index, keyword in enumerate(keywords)
+        }
+        for search in as_completed(searches):
+            try:
+                search.result()
+            except Exception:
+                logging.exception("Bing search failed: %s", searches[search])
+
+        # Workers download, parse and date each article (newspaper/lxml/dateparser);
+        # filtering, categorisation, event dates, summaries and NER run here on the main thread
+        for future in as_completed(futures):
+            url = futures[future]
+            title = url_to_meta[url]["title"]
+            matched_keywords = ", ".join(sorted(url_to_meta[url]["keywords"]))
+            pub_date_from_url = url_to_meta[url]["url_date"]
 
-            full_text, pub_date, summary = fetch_full_text_and_summary(url)
+            try:
+                full_text, pub_date, summary = future.result()
+            except Exception:
+                logging.exception("Article fetch failed: %s", url)
+                full_text, pub_date, summary = None, None, None
 
-            if pub_date_from_url and not (start_date <= pub_date_from_url.date() <= end_date):
-                continue
             if pub_date and not (start_date <= pub_date.date() <= end_date):
                 continue
 
-            if full_text and contains_keywords(full_text, all_keywords):
-                category = categorize_article(full_text)
-                named_entities = extract_named_entities(full_text)
+            text_lc = full_text.lower() if full_text else ""
+            if full_text and contains_keywords(full_text, keyword_automaton, text_lc):
+                category = categorize_article(full_text, text_lc)
                 event_date = extract_event_date(full_text)
-
-                final_data.append({
-                    "Title": title,
-                    "URL": url,
-                    "Published Date": pub_date.strftime('%Y-%m-%d') if pub_date else "Unknown",
-                    "Event Date": event_date,
-                    "Leader Mentioned": ", ".join([l for l in leaders if l.lower() in full_text.lower()]) or "Not Mentioned",
-                    "Category": category,
-                    "Named Entities": ", ".join(named_entities),
-                    "Summary": summary or (full_text[:500] + "...") if full_text else "No summary available."
-                })
+                leaders_found = find_keywords(full_text, leader_automaton, text_lc)
+                # summarise only articles that made it through the filters
+                summary = summary or summarize_text(full_text)
+
+                final_order.append(url_to_meta[url]["order"])
+                final_data["Title"].append(title)
+                final_data["URL"].append(url)
+                final_data["Published Date"].append(pub_date.strftime('%Y-%m-%d') if pub_date else "Unknown")
+                final_data["Event Date"].append(event_date)
+                final_data["Leader Mentioned"].append(", ".join([l for l in leaders if l.lower() in leaders_found]) or "Not Mentioned")
+                final_data["Matched Keywords"].append(matched_keywords)
+                final_data["Category"].append(category)
+                final_data["Summary"].append(summary or (full_text[:500] + "...") if full_text else "No summary available.")
+                final_texts.append(full_text)
             else:
                 final_date = pub_date or pub_date_from_url
-                failed_articles.append({
-                    "Title": title,
-                    "URL": url,
-                    "Published Date": final_date.strftime('%Y-%m-%d') if final_date else "Unknown"
-                })
-
-    return pd.DataFrame(final_data), pd.DataFrame(failed_articles)
-
-# BING pagination search function (your function — ensure you include it)
-def search_urls_bing_news(query, max_pages=5, delay=(2, 4)):
-    all_results = []
+                failed_order.append(url_to_meta[url]["order"])
+                failed_articles["Title"].append(title)
+                failed_articles["URL"].append(url)
+                failed_articles["Published Date"].append(final_date.strftime('%Y-%m-%d') if final_date else "Unknown")
+                failed_articles["Matched Keywords"].append(matched_keywords)
+
+    # NER is batched once all articles are in, rather than one nlp() call per article
+    final_data["Named Entities"] = [", ".join(named_entities) for named_entities in extract_named_entities(final_texts)]
+
+    # fetches complete in arbitrary order; report rows follow keyword order, then Bing rank
+    final_data = _sort_columns(final_data, final_order)
+    failed_articles = _sort_columns(failed_articles, failed_order)
+
+    df = pd.DataFrame(final_data, columns=RESULT_COLUMNS).astype("string")
+    errors_df = pd.DataFrame(failed_articles, columns=FAILED_COLUMNS).astype("string")
+    return df, errors_df
+
+class _EmptyBingPage(Exception):
+    """Raised for a results page with no items so it is not cached."""
+
+# Cached per page and only on success, so a failed or rate-limited page is retried
+# next run while pages already fetched are reused
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_bing_page(query, offset, delay=(2, 4)):
+    # politeness delay before each follow-up page; it sits inside the cached call so
+    # cache hits skip it, and a page's results are handed back as soon as it arrives
+    if offset:
+        time.sleep(random.uniform(*delay))
+    search_url = f"https://www.bing.com/news/search?q={quote(query)}&first={offset}"
+    res = SESSION.get(search_url, headers=_headers(), timeout=10)
+    res.raise_for_status()
+    # strain on the tag only: a class_ strainer compares the raw class string and
+    # would drop links like class="title foo", which select() still matches
+    soup = BeautifulSoup(res.text, "lxml", parse_only=SoupStrainer("a"))
+    items = soup.select("a.title")
+    if not items:
+        raise _EmptyBingPage(search_url)
+    return [{"title": item.get_text(strip=True), "url": item.get("href")} for item in items]
+
+def iter_bing_news_results(query, max_pages=5, delay=(2, 4)):
+    """Yield new results page by page, so callers can act on a page before the next is fetched."""
     seen_urls = set()
     page = 0
     while page < max_pages:
         offset = page * 10
-        search_url = f"https://www.bing.com/news/search?q={quote(query)}&first={offset}"
         try:
-            headers = {"User-Agent": random.choice(USER_AGENTS)}
-            res = requests.get(search_url, headers=headers, timeout=10)
-            res.raise_for_status()
-            soup = BeautifulSoup(res.text, "html.parser")
-            items = soup.select("a.title")
-            if not items:
-                break
-            for item in items:
-                title = item.get_text(strip=True)
-                url = item.get("href")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_results.append({"title": title, "url": url})
-            page += 1
-            time.sleep(random.uniform(*delay))
+            items = _fetch_bing_page(query, offset, delay)
+        except _EmptyBingPage:
+            break
         except Exception as e:
             logging.exception("Error while fetching Bing page: %s", e)
             break
-    return all_results
+        for item in items:
+            url = item["url"]
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                yield item
+        page += 1
+
+# BING pagination search function (your function — ensure you include it)
+def search_urls_bing_news(query, max_pages=5, delay=(2, 4)):
+    return list(iter_bing_news_results(query, max_pages, delay))
 
 # ---------------------- STREAMLIT UI ----------------------
 st.set_page_config(page_title="PR & Media Tracker", layout="wide")
@@ -271,12 +511,14 @@ if st.button("Search Articles"):
             st.dataframe(df, use_container_width=True)
 
             output = BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            # pandas writes cells column by column, so xlsxwriter's constant_memory mode can't be used here
+            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
                 df.to_excel(writer, index=False, sheet_name="Media Tracker")
                 errors_df.to_excel(writer, index=False, sheet_name="Access Issues")
             output.seek(0)
 
             st.download_button("📥 Download Excel Report", data=output, file_name="PR_Media_Report.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+            st.download_button("📄 Download CSV Report", data=df.to_csv(index=False).encode("utf-8"), file_name="PR_Media_Report.csv", mime="text/csv")
         else:
             st.warning("⚠️ No relevant articles found after pagination.")
 